@@ -34,6 +34,7 @@ from evidently.pydantic_utils import WithTestAndMetricDependencies
 from evidently.utils.data_preprocessing import DataDefinition
 
 if TYPE_CHECKING:
+    from evidently.metric_results import DatasetColumns
     from evidently.suite.base_suite import Context
 
 
@@ -126,6 +127,7 @@ class InputData:
     column_mapping: ColumnMapping
     data_definition: DataDefinition
     additional_data: Dict[str, Any]
+    columns_info: Optional["DatasetColumns"] = None
 
     @staticmethod
     def _get_by_column_name(dataset: pd.DataFrame, additional: pd.DataFrame, column: ColumnName) -> pd.Series:
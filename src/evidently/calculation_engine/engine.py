@@ -1,9 +1,12 @@
 import abc
 import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from typing import Generic
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -24,17 +27,22 @@ class Engine(Generic[TMetricImplementation, TInputData]):
     def __init__(self):
         self.metrics = []
         self.tests = []
+        self._execution_iterator: Optional[List[Tuple[Metric, TMetricImplementation]]] = None
 
     def set_metrics(self, metrics):
         self.metrics = metrics
+        self._execution_iterator = None
 
     def set_tests(self, tests):
         self.tests = tests
 
-    def execute_metrics(self, context, data: GenericInputData):
-        calculations: Dict[Metric, Union[ErrorResult, MetricResult]] = {}
+    def execute_metrics(self, context, data: GenericInputData, max_workers: Optional[int] = None):
         converted_data = self.convert_input_data(data)
         self.generate_additional_features(converted_data)
+        if max_workers is not None and max_workers > 1:
+            self._execute_metrics_parallel(context, converted_data, max_workers)
+            return
+        calculations: Dict[Metric, Union[ErrorResult, MetricResult]] = {}
         for metric, calculation in self.get_metric_execution_iterator():
             if calculation not in calculations:
                 logging.debug(f"Executing {type(calculation)}...")
@@ -46,6 +54,25 @@ class Engine(Generic[TMetricImplementation, TInputData]):
                 logging.debug(f"Using cached result for {type(calculation)}")
             context.metric_results[metric] = calculations[metric]
 
+    def _execute_metrics_parallel(self, context, data: TInputData, max_workers: int):
+        """
+        Calculate metrics in a thread pool, level by level:
+        metrics only run after all metrics they depend on are calculated.
+        """
+
+        def calculate(item: Tuple[Metric, TMetricImplementation]) -> Union[ErrorResult, MetricResult]:
+            _, calculation = item
+            logging.debug(f"Executing {type(calculation)}...")
+            try:
+                return calculation.calculate(context, data)
+            except BaseException as ex:
+                return ErrorResult(exception=ex)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in _split_by_dependency_level(self.get_metric_execution_iterator()):
+                for (metric, _), result in zip(level, executor.map(calculate, level)):
+                    context.metric_results[metric] = result
+
     @abc.abstractmethod
     def convert_input_data(self, data: GenericInputData) -> TInputData:
         raise NotImplementedError()
@@ -68,6 +95,12 @@ class Engine(Generic[TMetricImplementation, TInputData]):
         return impl(self, metric)
 
     def get_metric_execution_iterator(self) -> List[Tuple[Metric, TMetricImplementation]]:
+        # used both for additional features generation and for calculation, so build it once per metrics set
+        if self._execution_iterator is None:
+            self._execution_iterator = self._build_metric_execution_iterator()
+        return self._execution_iterator
+
+    def _build_metric_execution_iterator(self) -> List[Tuple[Metric, TMetricImplementation]]:
         aggregated: Dict[Type[Metric], List[Metric]] = functools.reduce(_aggregate_metrics, self.metrics, {})
         metric_to_calculations = {}
         for metric_type, metrics in aggregated.items():
@@ -83,6 +116,34 @@ class Engine(Generic[TMetricImplementation, TInputData]):
         return [(metric, self.get_metric_implementation(metric_to_calculations[metric])) for metric in self.metrics]
 
 
+def _metric_dependencies(metric: Metric) -> Iterator[Metric]:
+    if hasattr(metric, "__evidently_dependencies__"):
+        dependencies = (dependency for _, dependency in metric.__evidently_dependencies__())
+    else:
+        dependencies = iter(metric.__dict__.values())
+    return (dependency for dependency in dependencies if isinstance(dependency, Metric))
+
+
+def _split_by_dependency_level(
+    execution_iterator: List[Tuple[Metric, TMetricImplementation]]
+) -> List[List[Tuple[Metric, TMetricImplementation]]]:
+    # metrics are added after their dependencies, so a single pass is enough to assign levels
+    metric_levels: Dict[Metric, int] = {}
+    levels: List[List[Tuple[Metric, TMetricImplementation]]] = []
+    for metric, calculation in execution_iterator:
+        dependencies = list(_metric_dependencies(metric))
+        calculation_metric = getattr(calculation, "metric", metric)
+        if calculation_metric is not metric:
+            dependencies.append(calculation_metric)
+            dependencies.extend(_metric_dependencies(calculation_metric))
+        level = max((metric_levels.get(dependency, -1) + 1 for dependency in dependencies), default=0)
+        metric_levels[metric] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append((metric, calculation))
+    return levels
+
+
 def _aggregate_metrics(agg, item):
     agg[type(item)] = agg.get(type(item), []) + [item]
     return agg
@@ -11,6 +11,7 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.calculation_engine.engine import Engine
 from evidently.calculation_engine.metric_implementation import MetricImplementation
+from evidently.utils.data_operations import process_columns
 from evidently.utils.data_preprocessing import create_data_definition
 
 
@@ -27,6 +28,11 @@ class PythonEngine(Engine["PythonMetricImplementation", PythonInputData]):
             data.reference_data is not None and not isinstance(data.reference_data, pd.DataFrame)
         ):
             raise ValueError("PandasEngine works only with pd.DataFrame input data")
+        try:
+            columns_info = process_columns(data.current_data, data.column_mapping)
+        except Exception as e:
+            logging.debug(f"failed to process columns, metrics will process them separately: {e}")
+            columns_info = None
         return PythonInputData(
             data.reference_data,
             data.current_data,
@@ -35,6 +41,7 @@ class PythonEngine(Engine["PythonMetricImplementation", PythonInputData]):
             data.column_mapping,
             data.data_definition,
             additional_data=data.additional_data,
+            columns_info=columns_info,
         )
 
     def get_data_definition(self, current_data, reference_data, column_mapping: ColumnMapping):
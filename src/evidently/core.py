@@ -92,7 +92,7 @@ def np_inf_valudator(value):
 
 @pydantic_type_validator(np.ndarray)
 def np_array_valudator(value):
-    return np.array(value)
+    return np.asarray(value)
 
 
 class BaseResult(BaseModel):
@@ -55,7 +55,7 @@ class ClassificationDummyMetric(ThresholdClassificationMetric[ClassificationDumm
 
     def calculate(self, data: InputData) -> ClassificationDummyMetricResults:
         quality_metric: Optional[ClassificationQualityMetric]
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
 
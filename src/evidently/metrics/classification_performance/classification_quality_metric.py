@@ -36,7 +36,7 @@ class ClassificationQualityMetric(ThresholdClassificationMetric[ClassificationQu
         super().__init__(probas_threshold=probas_threshold, k=k, options=options)
 
     def calculate(self, data: InputData) -> ClassificationQualityMetricResult:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
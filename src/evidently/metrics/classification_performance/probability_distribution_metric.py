@@ -45,7 +45,7 @@ class ClassificationProbDistribution(Metric[ClassificationProbDistributionResult
         return result
 
     def calculate(self, data: InputData) -> ClassificationProbDistributionResults:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         prediction = columns.utility_columns.prediction
         target = columns.utility_columns.target
 
@@ -63,7 +63,7 @@ class ClassificationQualityByClass(ThresholdClassificationMetric[ClassificationQ
         super().__init__(probas_threshold, k, options=options)
 
     def calculate(self, data: InputData) -> ClassificationQualityByClassResult:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target, prediction = self.get_target_prediction_data(
             data.current_data,
             column_mapping=data.column_mapping,
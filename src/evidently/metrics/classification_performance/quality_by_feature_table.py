@@ -91,7 +91,7 @@ class ClassificationQualityByFeatureTable(Metric[ClassificationQualityByFeatureT
                 target_name="",
                 columns=[],
             )
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data.copy()
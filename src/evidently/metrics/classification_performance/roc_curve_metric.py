@@ -31,7 +31,7 @@ class ClassificationRocCurveResults(MetricResult):
 
 class ClassificationRocCurve(Metric[ClassificationRocCurveResults]):
     def calculate(self, data: InputData) -> ClassificationRocCurveResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
@@ -62,7 +62,7 @@ class ColumnValuePlot(Metric[ColumnValuePlotResults]):
         if self.column_name not in data.reference_data.columns:
             raise ValueError(f"Column '{self.column_name}' should present in the reference dataset")
 
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         if not (
             self.column_name in dataset_columns.num_feature_names
             or (
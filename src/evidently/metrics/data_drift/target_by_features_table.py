@@ -93,7 +93,7 @@ class TargetByFeaturesTable(Metric[TargetByFeaturesTableResults]):
                 columns=[],
                 task="",
             )
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None and prediction_name is None:
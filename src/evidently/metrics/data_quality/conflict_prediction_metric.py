@@ -25,7 +25,7 @@ class ConflictPredictionMetricResults(MetricResult):
 
 class ConflictPredictionMetric(Metric[ConflictPredictionMetricResults]):
     def calculate(self, data: InputData) -> ConflictPredictionMetricResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         prediction_name = dataset_columns.utility_columns.prediction
         if prediction_name is None:
             raise ValueError("The prediction column should be presented")
@@ -22,7 +22,7 @@ class ConflictTargetMetricResults(MetricResult):
 
 class ConflictTargetMetric(Metric[ConflictTargetMetricResults]):
     def calculate(self, data: InputData) -> ConflictTargetMetricResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         if target_name is None:
             raise ValueError("The column 'target' should be presented")
@@ -202,7 +202,7 @@ class DatasetCorrelationsMetric(Metric[DatasetCorrelationsMetricResult]):
     def calculate(self, data: InputData) -> DatasetCorrelationsMetricResult:
         target_correlation: Optional[str] = None
         data_definition = copy.deepcopy(data.data_definition)
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         curr_df = data.current_data.copy()
         ref_df: Optional[pd.DataFrame] = None
         if data.reference_data is not None:
@@ -86,7 +86,7 @@ class TextDescriptorsDistribution(Metric[TextDescriptorsDistributionResult]):
             if self.column_name not in data.reference_data:
                 raise ValueError(f"Column '{self.column_name}' was not found in reference data.")
 
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         column_type = recognize_column_type(dataset=data.current_data, column_name=self.column_name, columns=columns)
         if column_type != "text":
             raise ValueError("Text column expected")
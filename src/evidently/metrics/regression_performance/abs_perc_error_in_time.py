@@ -9,6 +9,7 @@ from evidently.base_metric import Metric
 from evidently.metric_results import ColumnAggScatterResult
 from evidently.metric_results import ColumnScatter
 from evidently.metric_results import ColumnScatterResult
+from evidently.metrics.regression_performance.utils import make_df_for_plot
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
 from evidently.renderers.base_renderer import MetricRenderer
@@ -25,23 +26,23 @@ class RegressionAbsPercentageErrorPlot(Metric[ColumnScatterResult]):
         super().__init__(options=options)
 
     def calculate(self, data: InputData) -> ColumnScatterResult:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         datetime_column_name = dataset_columns.utility_columns.date
-        curr_df = data.current_data.copy()
+        curr_df = data.current_data
         ref_df = data.reference_data
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
         if not isinstance(prediction_name, str):
             raise ValueError("Expect one column for prediction. List of columns was provided.")
-        curr_df = self._make_df_for_plot(curr_df, target_name, prediction_name, datetime_column_name)
+        curr_df = make_df_for_plot(curr_df, target_name, prediction_name, datetime_column_name)
         curr_df["Absolute Percentage Error"] = (
             100 * np.abs(curr_df[prediction_name] - curr_df[target_name]) / curr_df[target_name]
         )
         curr_df.dropna(axis=0, how="any", inplace=True, subset=["Absolute Percentage Error"])
         if ref_df is not None:
-            ref_df = self._make_df_for_plot(ref_df.copy(), target_name, prediction_name, datetime_column_name)
+            ref_df = make_df_for_plot(ref_df, target_name, prediction_name, datetime_column_name)
             ref_df["Absolute Percentage Error"] = (
                 100 * np.abs(ref_df[prediction_name] - ref_df[target_name]) / ref_df[target_name]
             )
@@ -97,19 +98,6 @@ class RegressionAbsPercentageErrorPlot(Metric[ColumnScatterResult]):
             x_name_ref=x_name_ref,
         )
 
-    def _make_df_for_plot(self, df, target_name: str, prediction_name: str, datetime_column_name: Optional[str]):
-        result = df.replace([np.inf, -np.inf], np.nan)
-        if datetime_column_name is not None:
-            result.dropna(
-                axis=0,
-                how="any",
-                inplace=True,
-                subset=[target_name, prediction_name, datetime_column_name],
-            )
-            return result.sort_values(datetime_column_name)
-        result.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-        return result.sort_index()
-
 
 @default_renderer(wrap_type=RegressionAbsPercentageErrorPlot)
 class RegressionAbsPercentageErrorPlotRenderer(MetricRenderer):
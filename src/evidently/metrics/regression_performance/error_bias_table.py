@@ -131,7 +131,7 @@ class RegressionErrorBiasTable(Metric[RegressionErrorBiasTableResults]):
                 f"top error should be in range ({self.TOP_ERROR_MIN}, {self.TOP_ERROR_MAX})."
             )
 
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data
@@ -1,12 +1,11 @@
 from typing import List
 from typing import Optional
 
-import numpy as np
-
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.metric_results import HistogramData
+from evidently.metrics.regression_performance.utils import make_df_for_plot
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
@@ -27,7 +26,7 @@ class RegressionErrorDistributionResults(MetricResult):
 
 class RegressionErrorDistribution(Metric[RegressionErrorDistributionResults]):
     def calculate(self, data: InputData) -> RegressionErrorDistributionResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data
@@ -36,11 +35,11 @@ class RegressionErrorDistribution(Metric[RegressionErrorDistributionResults]):
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
         if not isinstance(prediction_name, str):
             raise ValueError("Expect one column for prediction. List of columns was provided.")
-        curr_df = self._make_df_for_plot(curr_df, target_name, prediction_name, None)
+        curr_df = make_df_for_plot(curr_df, target_name, prediction_name, None)
         curr_error = curr_df[prediction_name] - curr_df[target_name]
         ref_error = None
         if ref_df is not None:
-            ref_df = self._make_df_for_plot(ref_df, target_name, prediction_name, None)
+            ref_df = make_df_for_plot(ref_df, target_name, prediction_name, None)
             ref_error = ref_df[prediction_name] - ref_df[target_name]
 
         result = make_hist_for_num_plot(curr_error, ref_error)
@@ -49,19 +48,6 @@ class RegressionErrorDistribution(Metric[RegressionErrorDistributionResults]):
 
         return RegressionErrorDistributionResults(current_bins=current_bins, reference_bins=reference_bins)
 
-    def _make_df_for_plot(self, df, target_name: str, prediction_name: str, datetime_column_name: Optional[str]):
-        result = df.replace([np.inf, -np.inf], np.nan)
-        if datetime_column_name is not None:
-            result.dropna(
-                axis=0,
-                how="any",
-                inplace=True,
-                subset=[target_name, prediction_name, datetime_column_name],
-            )
-            return result.sort_values(datetime_column_name)
-        result.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-        return result.sort_index()
-
 
 @default_renderer(wrap_type=RegressionErrorDistribution)
 class RegressionErrorDistributionRenderer(MetricRenderer):
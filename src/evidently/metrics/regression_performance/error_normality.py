@@ -4,7 +4,6 @@ from typing import List
 from typing import Optional
 from typing import Union
 
-import numpy as np
 import pandas as pd
 from plotly import graph_objs as go
 from plotly.subplots import make_subplots
@@ -13,6 +12,7 @@ from scipy.stats import probplot
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
+from evidently.metrics.regression_performance.utils import make_df_for_plot
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
 from evidently.renderers.base_renderer import MetricRenderer
@@ -37,7 +37,7 @@ class RegressionErrorNormality(Metric[RegressionErrorNormalityResults]):
         super().__init__(options=options)
 
     def calculate(self, data: InputData) -> RegressionErrorNormalityResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data
@@ -49,7 +49,7 @@ class RegressionErrorNormality(Metric[RegressionErrorNormalityResults]):
         agg_data = True
         if self.get_options().render_options.raw_data:
             agg_data = False
-        curr_df = self._make_df_for_plot(curr_df, target_name, prediction_name, None)
+        curr_df = make_df_for_plot(curr_df, target_name, prediction_name, None)
         current_error = curr_df[prediction_name] - curr_df[target_name]
         curr_qq_lines = probplot(current_error, dist="norm", plot=None)
         current_theoretical = self._get_theoretical_line(curr_qq_lines)
@@ -57,7 +57,7 @@ class RegressionErrorNormality(Metric[RegressionErrorNormalityResults]):
         reference_theoretical = None
         reference_plot_data = None
         if ref_df is not None:
-            ref_df = self._make_df_for_plot(ref_df, target_name, prediction_name, None)
+            ref_df = make_df_for_plot(ref_df, target_name, prediction_name, None)
             reference_error = ref_df[prediction_name] - ref_df[target_name]
             ref_qq_lines = probplot(reference_error, dist="norm", plot=None)
             reference_theoretical = self._get_theoretical_line(ref_qq_lines)
@@ -69,19 +69,6 @@ class RegressionErrorNormality(Metric[RegressionErrorNormalityResults]):
             reference_theoretical=reference_theoretical,
         )
 
-    def _make_df_for_plot(self, df, target_name: str, prediction_name: str, datetime_column_name: Optional[str]):
-        result = df.replace([np.inf, -np.inf], np.nan)
-        if datetime_column_name is not None:
-            result.dropna(
-                axis=0,
-                how="any",
-                inplace=True,
-                subset=[target_name, prediction_name, datetime_column_name],
-            )
-            return result.sort_values(datetime_column_name)
-        result.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-        return result.sort_index()
-
     def _get_theoretical_line(self, res: Any):
         x = [res[0][0][0], res[0][0][-1]]
         y = [res[1][0] * res[0][0][0] + res[1][1], res[1][0] * res[0][0][-1] + res[1][1]]
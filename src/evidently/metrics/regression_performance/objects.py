@@ -1,34 +1,16 @@
-from typing import Dict
 from typing import List
 from typing import Optional
-from typing import overload
 
+import numpy as np
 import pandas as pd
 from pandas import Interval
 
 from evidently.base_metric import MetricResult
-from evidently.metric_results import ScatterData
 
 
 class PredActualScatter(MetricResult):
-    predicted: ScatterData
-    actual: ScatterData
-
-
-@overload
-def scatter_as_dict(scatter: PredActualScatter) -> Dict[str, ScatterData]:
-    ...
-
-
-@overload
-def scatter_as_dict(scatter: Optional[PredActualScatter]) -> Optional[Dict[str, ScatterData]]:
-    ...
-
-
-def scatter_as_dict(scatter: Optional[PredActualScatter]) -> Optional[Dict[str, ScatterData]]:
-    if scatter is None:
-        return None
-    return scatter.dict()
+    predicted: np.ndarray
+    actual: np.ndarray
 
 
 class RegressionScatter(MetricResult):
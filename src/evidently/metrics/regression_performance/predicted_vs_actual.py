@@ -1,8 +1,11 @@
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
+import pandas as pd
 
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
@@ -11,20 +14,26 @@ from evidently.core import IncludeTags
 from evidently.metric_results import ContourData
 from evidently.metric_results import raw_agg_properties
 from evidently.metrics.regression_performance.objects import PredActualScatter
-from evidently.metrics.regression_performance.objects import scatter_as_dict
+from evidently.metrics.regression_performance.utils import make_df_for_plot
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
+from evidently.renderers.html_widgets import GraphData
 from evidently.renderers.html_widgets import WidgetSize
 from evidently.renderers.html_widgets import header_text
-from evidently.renderers.html_widgets import plotly_figure
+from evidently.renderers.html_widgets import plotly_graph
 from evidently.utils.data_operations import process_columns
+from evidently.utils.visualizations import get_binned_density
 from evidently.utils.visualizations import get_gaussian_kde
 from evidently.utils.visualizations import is_possible_contour
 from evidently.utils.visualizations import plot_contour
 from evidently.utils.visualizations import plot_scatter
 
+PLOT_SIGNIFICANT_DIGITS = 5
+# above this size kernel density estimation gets too expensive and a 2d histogram is used instead
+KDE_MAX_POINTS = 50000
+
 
 class AggPredActualScatter(MetricResult):
     class Config:
@@ -38,11 +47,15 @@ class RegressionPredictedVsActualScatterResults(MetricResult):
     class Config:
         dict_include = False
         tags = {IncludeTags.Render}
+        underscore_attrs_are_private = True
 
     current: Union[PredActualScatter, AggPredActualScatter]
     reference: Optional[Union[PredActualScatter, AggPredActualScatter]]
     agg_data: bool
 
+    # plotly figure dict of aggregated data, kept to reuse between renders
+    _agg_figure: Optional[dict] = None
+
     current_raw, current_agg = raw_agg_properties("current", PredActualScatter, AggPredActualScatter, False)
     reference_raw, reference_agg = raw_agg_properties("reference", PredActualScatter, AggPredActualScatter, True)
 
@@ -52,7 +65,7 @@ class RegressionPredictedVsActualScatter(Metric[RegressionPredictedVsActualScatt
         super().__init__(options=options)
 
     def calculate(self, data: InputData) -> RegressionPredictedVsActualScatterResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data
@@ -61,51 +74,76 @@ class RegressionPredictedVsActualScatter(Metric[RegressionPredictedVsActualScatt
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
         if not isinstance(prediction_name, str):
             raise ValueError("Expect one column for prediction. List of columns was provided.")
-        curr_df = self._make_df_for_plot(curr_df.copy(), target_name, prediction_name, None)
+        curr_df = make_df_for_plot(curr_df, target_name, prediction_name, None)
+        curr_predicted, curr_actual = _to_float_values(curr_df, prediction_name, target_name)
+        ref_predicted: Optional[np.ndarray] = None
+        ref_actual: Optional[np.ndarray] = None
         if ref_df is not None:
-            ref_df = self._make_df_for_plot(ref_df.copy(), target_name, prediction_name, None)
+            ref_df = make_df_for_plot(ref_df, target_name, prediction_name, None)
+            ref_predicted, ref_actual = _to_float_values(ref_df, prediction_name, target_name)
 
         if (
             self.get_options().render_options.raw_data
-            or not is_possible_contour(curr_df[prediction_name], curr_df[target_name])
-            or (ref_df is not None and not is_possible_contour(ref_df[prediction_name], ref_df[target_name]))
+            or not is_possible_contour(curr_predicted, curr_actual)
+            or (ref_df is not None and not is_possible_contour(ref_predicted, ref_actual))
         ):
             curr_df.drop_duplicates(subset=[prediction_name, target_name], inplace=True)
-            current_scatter = PredActualScatter(predicted=curr_df[prediction_name], actual=curr_df[target_name])
+            predicted, actual = _to_float_values(curr_df, prediction_name, target_name)
+            current_scatter = PredActualScatter(predicted=predicted, actual=actual)
             reference_scatter: Optional[PredActualScatter] = None
             if ref_df is not None:
                 ref_df.drop_duplicates(subset=[prediction_name, target_name], inplace=True)
-                reference_scatter = PredActualScatter(predicted=ref_df[prediction_name], actual=ref_df[target_name])
+                predicted, actual = _to_float_values(ref_df, prediction_name, target_name)
+                reference_scatter = PredActualScatter(predicted=predicted, actual=actual)
             return RegressionPredictedVsActualScatterResults(
                 current=current_scatter, reference=reference_scatter, agg_data=False
             )
 
-        current_agg = AggPredActualScatter(data=get_gaussian_kde(curr_df[prediction_name], curr_df[target_name]))
+        current_agg = AggPredActualScatter(data=self._get_density(curr_predicted, curr_actual))
         reference_agg = AggPredActualScatter(data=None)
-        if ref_df is not None:
-            reference_agg = AggPredActualScatter(data=get_gaussian_kde(ref_df[prediction_name], ref_df[target_name]))
+        if ref_predicted is not None and ref_actual is not None:
+            reference_agg = AggPredActualScatter(data=self._get_density(ref_predicted, ref_actual))
         return RegressionPredictedVsActualScatterResults(current=current_agg, reference=reference_agg, agg_data=True)
 
-    def _make_df_for_plot(self, df, target_name: str, prediction_name: str, datetime_column_name: Optional[str]):
-        result = df.replace([np.inf, -np.inf], np.nan)
-        if datetime_column_name is not None:
-            result.dropna(
-                axis=0,
-                how="any",
-                inplace=True,
-                subset=[target_name, prediction_name, datetime_column_name],
-            )
-            return result.sort_values(datetime_column_name)
-        result.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-        return result.sort_index()
+    @staticmethod
+    def _get_density(predicted: np.ndarray, actual: np.ndarray) -> ContourData:
+        if len(predicted) > KDE_MAX_POINTS:
+            return get_binned_density(predicted, actual)
+        return get_gaussian_kde(predicted, actual)
+
+
+def _to_float_values(df: pd.DataFrame, prediction_name: str, target_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    # nullable, boolean and object columns are plotted as plain float values
+    return df[prediction_name].to_numpy(dtype=float), df[target_name].to_numpy(dtype=float)
+
+
+def _round_to_plot_resolution(values: np.ndarray) -> np.ndarray:
+    # digits beyond the plot resolution are invisible but make up most of the serialized figure
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return values
+    magnitude = np.ptp(values) or np.abs(values).max()
+    if magnitude == 0:
+        return values
+    decimals = PLOT_SIGNIFICANT_DIGITS - int(np.floor(np.log10(magnitude))) - 1
+    return np.round(values, max(decimals, 0))
+
+
+def _scatter_for_plot(scatter: Optional[PredActualScatter]) -> Optional[Dict[str, np.ndarray]]:
+    if scatter is None:
+        return None
+    return {
+        "actual": _round_to_plot_resolution(scatter.actual),
+        "predicted": _round_to_plot_resolution(scatter.predicted),
+    }
 
 
 @default_renderer(wrap_type=RegressionPredictedVsActualScatter)
 class RegressionPredictedVsActualScatterRenderer(MetricRenderer):
     def render_raw(self, current: PredActualScatter, reference: Optional[PredActualScatter]):
         fig = plot_scatter(
-            curr=scatter_as_dict(current),
-            ref=scatter_as_dict(reference),
+            curr=_scatter_for_plot(current),
+            ref=_scatter_for_plot(reference),
             x="actual",
             y="predicted",
             xaxis_name="Actual value",
@@ -122,18 +160,32 @@ class RegressionPredictedVsActualScatterRenderer(MetricRenderer):
             ),
         ]
 
-    def render_agg(self, current: AggPredActualScatter, reference: Optional[AggPredActualScatter]):
+    def render_agg(
+        self,
+        current: AggPredActualScatter,
+        reference: Optional[AggPredActualScatter],
+        figure: Optional[dict] = None,
+    ):
+        if figure is None:
+            figure = self.get_agg_figure(current, reference)
+        return [
+            header_text(label="Predicted vs Actual"),
+            plotly_graph(graph_data=GraphData("", figure["data"], figure["layout"]), size=WidgetSize.FULL),
+        ]
+
+    @staticmethod
+    def get_agg_figure(current: AggPredActualScatter, reference: Optional[AggPredActualScatter]) -> dict:
         if current.data is None:
             raise ValueError("Current data should be present")
         ref_data: Optional[ContourData] = None
         if reference is not None:
             ref_data = reference.data
-        fig = plot_contour(current.data, ref_data, "Actual value", "Predicted value")
-
-        return [header_text(label="Predicted vs Actual"), plotly_figure(title="", figure=fig, size=WidgetSize.FULL)]
+        return plot_contour(current.data, ref_data, "Actual value", "Predicted value").to_plotly_json()
 
     def render_html(self, obj: RegressionPredictedVsActualScatter) -> List[BaseWidgetInfo]:
         result = obj.get_result()
         if not result.agg_data:
             return self.render_raw(result.current_raw, result.reference_raw)
-        return self.render_agg(result.current_agg, result.reference_agg)
+        if result._agg_figure is None:
+            result._agg_figure = self.get_agg_figure(result.current_agg, result.reference_agg)
+        return self.render_agg(result.current_agg, result.reference_agg, result._agg_figure)
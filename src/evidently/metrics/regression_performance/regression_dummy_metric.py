@@ -48,7 +48,7 @@ class RegressionDummyMetric(Metric[RegressionDummyMetricResults]):
 
     def calculate(self, data: InputData) -> RegressionDummyMetricResults:
         quality_metric: Optional[RegressionQualityMetric]
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
 
@@ -73,7 +73,7 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         return ()
 
     def calculate(self, data: InputData) -> RegressionPerformanceMetricsResults:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
 
         current_metrics = calculate_regression_performance(
             dataset=data.current_data, columns=columns, error_bias_prefix="current_"
@@ -58,7 +58,7 @@ class RegressionQualityMetricResults(MetricResult):
 
 class RegressionQualityMetric(Metric[RegressionQualityMetricResults]):
     def calculate(self, data: InputData) -> RegressionQualityMetricResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
 
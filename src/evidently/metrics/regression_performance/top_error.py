@@ -15,6 +15,7 @@ from evidently.metric_results import ContourData
 from evidently.metric_results import raw_agg_properties
 from evidently.metrics.regression_performance.objects import PredActualScatter
 from evidently.metrics.regression_performance.objects import RegressionScatter
+from evidently.metrics.regression_performance.utils import make_df_for_plot
 from evidently.metrics.regression_performance.visualization import plot_error_bias_colored_scatter
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
@@ -54,16 +55,16 @@ class RegressionTopErrorMetricResults(MetricResult):
 
 class RegressionTopErrorMetric(Metric[RegressionTopErrorMetricResults]):
     def calculate(self, data: InputData) -> RegressionTopErrorMetricResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.columns_info or process_columns(data.current_data, data.column_mapping)
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
-        curr_df = data.current_data.copy()
+        curr_df = data.current_data
         ref_df = data.reference_data
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
         if not isinstance(prediction_name, str):
             raise ValueError("Expect one column for prediction. List of columns was provided.")
-        curr_df = self._make_df_for_plot(curr_df, target_name, prediction_name, None)
+        curr_df = make_df_for_plot(curr_df, target_name, prediction_name, None)
         curr_error = curr_df[prediction_name] - curr_df[target_name]
         quantile_5 = np.quantile(curr_error, 0.05)
         quantile_95 = np.quantile(curr_error, 0.95)
@@ -78,7 +79,7 @@ class RegressionTopErrorMetric(Metric[RegressionTopErrorMetricResults]):
 
         reference: Optional[Union[TopData, AggTopData]] = None
         if ref_df is not None:
-            ref_df = self._make_df_for_plot(ref_df.copy(), target_name, prediction_name, None)
+            ref_df = make_df_for_plot(ref_df, target_name, prediction_name, None)
             ref_error = ref_df[prediction_name] - ref_df[target_name]
             quantile_5 = np.quantile(ref_error, 0.05)
             quantile_95 = np.quantile(ref_error, 0.95)
@@ -118,19 +119,6 @@ class RegressionTopErrorMetric(Metric[RegressionTopErrorMetricResults]):
             agg_data=True,
         )
 
-    def _make_df_for_plot(self, df, target_name: str, prediction_name: str, datetime_column_name: Optional[str]):
-        result = df.replace([np.inf, -np.inf], np.nan)
-        if datetime_column_name is not None:
-            result.dropna(
-                axis=0,
-                how="any",
-                inplace=True,
-                subset=[target_name, prediction_name, datetime_column_name],
-            )
-            return result.sort_values(datetime_column_name)
-        result.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-        return result.sort_index()
-
     @staticmethod
     def _get_data_for_scatter(df: pd.DataFrame, target_name: str, prediction_name: str) -> RegressionScatter:
         underestimation = PredActualScatter(
@@ -1,3 +1,8 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
 from evidently.metrics.regression_performance.objects import IntervalSeries
 from evidently.metrics.regression_performance.objects import RegressionMetricScatter
 
@@ -24,3 +29,38 @@ def apply_func_to_binned_data(
     )
 
     return result
+
+
+def _drop_not_finite(mask: np.ndarray, column: pd.Series) -> None:
+    """Unset mask values in place for rows where the column is NaN or infinite."""
+    if isinstance(column.dtype, np.dtype):
+        if column.dtype.kind in "iub":
+            # plain integer and boolean columns have no missing or infinite values
+            return
+        if column.dtype.kind == "f":
+            mask &= np.isfinite(column.to_numpy())
+            return
+    mask &= np.isfinite(column.to_numpy(dtype=float, na_value=np.nan))
+
+
+def make_df_for_plot(
+    df: pd.DataFrame, target_name: str, prediction_name: str, datetime_column_name: Optional[str]
+) -> pd.DataFrame:
+    """Select rows with finite target and prediction (and set datetime, if any), sorted by datetime or index.
+
+    Only target, prediction and datetime columns are returned.
+    """
+    columns = [target_name, prediction_name]
+    mask = np.ones(len(df), dtype=bool)
+    _drop_not_finite(mask, df[target_name])
+    _drop_not_finite(mask, df[prediction_name])
+    if datetime_column_name is not None:
+        columns.append(datetime_column_name)
+        mask &= df[datetime_column_name].notna().to_numpy()
+    positions = np.flatnonzero(mask)
+    if datetime_column_name is not None:
+        sort_keys = df[datetime_column_name].to_numpy()[positions]
+        positions = positions[np.argsort(sort_keys, kind="stable")]
+    elif not df.index[positions].is_monotonic_increasing:
+        positions = positions[np.argsort(df.index.to_numpy()[positions], kind="stable")]
+    return df.iloc[positions, df.columns.get_indexer(columns)]
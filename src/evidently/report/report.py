@@ -1,12 +1,16 @@
-import dataclasses
 import datetime
+import json
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
+from typing import TypeVar
 from typing import Union
 
 import pandas as pd
@@ -20,9 +24,10 @@ from evidently.metric_preset.metric_preset import MetricPreset
 from evidently.metric_results import DatasetColumns
 from evidently.model.dashboard import DashboardInfo
 from evidently.model.widget import AdditionalGraphInfo
+from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
 from evidently.pipeline.column_mapping import ColumnMapping
-from evidently.renderers.base_renderer import DetailsInfo
+from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import WidgetIdGenerator
 from evidently.renderers.base_renderer import replace_widgets_ids
 from evidently.suite.base_suite import MetadataValueType
@@ -30,15 +35,20 @@ from evidently.suite.base_suite import ReportBase
 from evidently.suite.base_suite import Snapshot
 from evidently.suite.base_suite import Suite
 from evidently.suite.base_suite import find_metric_renderer
+from evidently.utils import NumpyEncoder
+from evidently.utils.dashboard import dataclass_to_dict
 from evidently.utils.generators import BaseGenerator
 
 METRIC_GENERATORS = "metric_generators"
 METRIC_PRESETS = "metric_presets"
 
+T = TypeVar("T")
+
 
 class Report(ReportBase):
     _columns_info: DatasetColumns
     _first_level_metrics: List[Union[Metric]]
+    _metric_renderers: Dict[int, MetricRenderer]
     metrics: List[Union[Metric, MetricPreset, BaseGenerator]]
 
     def __init__(
@@ -54,15 +64,22 @@ class Report(ReportBase):
         batch_size: str = None,
         dataset_id: str = None,
         name: str = None,
+        render_max_workers: Optional[int] = None,
+        calculation_max_workers: Optional[int] = None,
     ):
         super().__init__(options, timestamp, name)
         # just save all metrics and metric presets
         self.metrics = metrics
         self._inner_suite = Suite(self.options)
         self._first_level_metrics = []
+        self._metric_renderers = {}
         self.id = id or uuid.uuid4()
         self.metadata = metadata or {}
         self.tags = tags or []
+        # metrics are rendered in a thread pool of this size, sequentially if not set
+        self.render_max_workers = render_max_workers
+        # independent metrics are calculated in a thread pool of this size, sequentially if not set
+        self.calculation_max_workers = calculation_max_workers
         if model_id is not None:
             self.set_model_id(model_id)
         if batch_size is not None:
@@ -89,6 +106,7 @@ class Report(ReportBase):
 
         self._inner_suite.reset()
         self._inner_suite.set_engine(PythonEngine() if engine is None else engine())
+        self._metric_renderers = {}
 
         if self._inner_suite.context.engine is None:
             raise ValueError("No Engine is set")
@@ -143,7 +161,7 @@ class Report(ReportBase):
         data = GenericInputData(
             reference_data, current_data, column_mapping, data_definition, additional_data=additional_data or {}
         )
-        self._inner_suite.run_calculate(data)
+        self._inner_suite.run_calculate(data, max_workers=self.calculation_max_workers)
 
     def as_dict(  # type: ignore[override]
         self,
@@ -152,43 +170,77 @@ class Report(ReportBase):
         exclude: Dict[str, IncludeOptions] = None,
         **kwargs,
     ) -> dict:
-        metrics = []
         include = include or {}
         exclude = exclude or {}
-        for metric in self._first_level_metrics:
-            renderer = find_metric_renderer(type(metric), self._inner_suite.context.renderers)
-            metric_id = metric.get_id()
-            metrics.append(
-                {
-                    "metric": metric_id,
-                    "result": renderer.render_json(
-                        metric,
-                        include_render=include_render,
-                        include=include.get(metric_id),
-                        exclude=exclude.get(metric_id),
-                    ),
-                }
-            )
+
+        def render(metric: Metric) -> dict:
+            return self._render_metric_json(metric, include_render, include, exclude)
+
+        metrics = self._render_first_level_metrics(render)
 
         return {
             "metrics": metrics,
         }
 
+    def stream_as_json(
+        self,
+        fp: IO[str],
+        include_render: bool = False,
+        include: Dict[str, IncludeOptions] = None,
+        exclude: Dict[str, IncludeOptions] = None,
+        **kwargs,
+    ):
+        """Write the same content as `as_dict` to a file-like object as json, one metric at a time.
+
+        Only one metric result is kept in memory at once, so metrics are rendered sequentially.
+        """
+        include = include or {}
+        exclude = exclude or {}
+        fp.write('{"metrics": [')
+        for i, metric in enumerate(self._first_level_metrics):
+            if i > 0:
+                fp.write(", ")
+            json.dump(
+                self._render_metric_json(metric, include_render, include, exclude),
+                fp,
+                cls=NumpyEncoder,
+                allow_nan=True,
+            )
+        fp.write("]}")
+
+    def _render_metric_json(
+        self,
+        metric: Metric,
+        include_render: bool,
+        include: Dict[str, IncludeOptions],
+        exclude: Dict[str, IncludeOptions],
+    ) -> dict:
+        renderer = self._get_metric_renderer(metric)
+        metric_id = metric.get_id()
+        return {
+            "metric": metric_id,
+            "result": renderer.render_json(
+                metric,
+                include_render=include_render,
+                include=include.get(metric_id),
+                exclude=exclude.get(metric_id),
+            ),
+        }
+
     def as_dataframe(self, group: str = None) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
         metrics = defaultdict(list)
 
         for metric in self._first_level_metrics:
-            renderer = find_metric_renderer(type(metric), self._inner_suite.context.renderers)
             metric_id = metric.get_id()
-            metric_hash = metric.get_object_hash()
             if group is not None and metric_id != group:
                 continue
+            renderer = self._get_metric_renderer(metric)
             df = renderer.render_pandas(metric)
             df["metric_id"] = metric_id
-            df["metric_hash"] = metric_hash
+            df["metric_hash"] = metric.get_object_hash()
             metrics[metric_id].append(df)
 
-        result = {cls: pd.concat(val) for cls, val in metrics.items()}
+        result = {cls: val[0] if len(val) == 1 else pd.concat(val, copy=False) for cls, val in metrics.items()}
         if group is None and len(result) == 1:
             return next(iter(result.values()))
         if group is None:
@@ -199,38 +251,52 @@ class Report(ReportBase):
 
     def _build_dashboard_info(self):
         metrics_results = []
-        additional_graphs = []
+        additional_graphs = {}
 
         color_options = self.options.color_options
 
-        id_generator = WidgetIdGenerator("")
-        for test in self._first_level_metrics:
-            id_generator.base_id = test.get_id()
-            renderer = find_metric_renderer(type(test), self._inner_suite.context.renderers)
+        def render(metric: Metric) -> List[BaseWidgetInfo]:
+            renderer = self._get_metric_renderer(metric)
             # set the color scheme from the report for each render
             renderer.color_options = color_options
-            html_info = renderer.render_html(test)
+            return renderer.render_html(metric)
+
+        id_generator = WidgetIdGenerator("")
+        for test, html_info in zip(self._first_level_metrics, self._render_first_level_metrics(render)):
+            # ids are assigned in metrics order so they do not depend on rendering order
+            id_generator.base_id = test.get_id()
             replace_widgets_ids(html_info, id_generator)
 
             for info_item in html_info:
                 for additional_graph in info_item.get_additional_graphs():
+                    # widgets have params too, so graph infos are told apart by type
                     if isinstance(additional_graph, AdditionalGraphInfo):
-                        additional_graphs.append(DetailsInfo("", additional_graph.params, additional_graph.id))
-
+                        info = additional_graph.params
                     else:
-                        additional_graphs.append(DetailsInfo("", additional_graph, additional_graph.id))
+                        info = additional_graph
+                    additional_graphs[f"{additional_graph.id}"] = dataclass_to_dict(info)
 
             metrics_results.extend(html_info)
 
         return (
-            "evidently_dashboard_" + str(uuid.uuid4()).replace("-", ""),
+            f"evidently_dashboard_{uuid.uuid4().hex}",
             DashboardInfo("Report", widgets=[result for result in metrics_results]),
-            {
-                f"{item.id}": dataclasses.asdict(item.info) if dataclasses.is_dataclass(item.info) else item.info
-                for item in additional_graphs
-            },
+            additional_graphs,
         )
 
+    def _get_metric_renderer(self, metric: Metric) -> MetricRenderer:
+        renderer = self._metric_renderers.get(id(metric))
+        if renderer is None:
+            renderer = find_metric_renderer(type(metric), self._inner_suite.context.renderers)
+            self._metric_renderers[id(metric)] = renderer
+        return renderer
+
+    def _render_first_level_metrics(self, render: Callable[[Metric], T]) -> List[T]:
+        if self.render_max_workers is None or self.render_max_workers <= 1 or len(self._first_level_metrics) <= 1:
+            return [render(metric) for metric in self._first_level_metrics]
+        with ThreadPoolExecutor(max_workers=self.render_max_workers) as executor:
+            return list(executor.map(render, self._first_level_metrics))
+
     def set_batch_size(self, batch_size: str):
         self.metadata["batch_size"] = batch_size
         return self
@@ -249,7 +315,8 @@ class Report(ReportBase):
 
     def _get_snapshot(self) -> Snapshot:
         snapshot = super()._get_snapshot()
-        snapshot.metrics_ids = [snapshot.suite.metrics.index(m) for m in self._first_level_metrics]
+        positions = {metric: i for i, metric in enumerate(snapshot.suite.metrics)}
+        snapshot.metrics_ids = [positions[m] for m in self._first_level_metrics]
         return snapshot
 
     @classmethod
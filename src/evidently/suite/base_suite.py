@@ -319,7 +319,7 @@ class Suite:
         self.context.engine.set_tests(self.context.tests)
         self.context.state = States.Verified
 
-    def run_calculate(self, data: GenericInputData):
+    def run_calculate(self, data: GenericInputData, max_workers: Optional[int] = None):
         if self.context.state in [States.Init]:
             self.verify()
 
@@ -328,7 +328,7 @@ class Suite:
 
         self.context.metric_results = {}
         if self.context.engine is not None:
-            self.context.engine.execute_metrics(self.context, data)
+            self.context.engine.execute_metrics(self.context, data, max_workers=max_workers)
 
         self.context.state = States.Calculated
 
@@ -171,7 +171,7 @@ class Project(BaseModel):
     ):
         dashboard_info = self.build_dashboard_info(timestamp_start, timestamp_end)
         template_params = TemplateParams(
-            dashboard_id="pd_" + str(uuid.uuid4()).replace("-", ""),
+            dashboard_id=f"pd_{uuid.uuid4().hex}",
             dashboard_info=dashboard_info,
             additional_graphs={},
         )
@@ -1,14 +1,16 @@
 import base64
 import dataclasses
+import functools
 import html
 import json
 import os
 import shutil
-from dataclasses import asdict
 from enum import Enum
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import evidently
 from evidently.model.dashboard import DashboardInfo
@@ -77,8 +79,32 @@ def save_data_file(filename: str, mode: SaveMode, dashboard_id, dashboard_info:
     return data_file
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def dataclass_to_dict(obj: Any) -> Any:
+    """Convert dataclasses to dicts recursively, like `dataclasses.asdict`.
+
+    Unlike `dataclasses.asdict` other values are not deep copied,
+    so large widget data (lists, numpy arrays) is shared with the original object.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {name: dataclass_to_dict(getattr(obj, name)) for name in _field_names(type(obj))}
+    if isinstance(obj, list):
+        return [dataclass_to_dict(item) for item in obj]
+    if isinstance(obj, tuple):
+        if hasattr(obj, "_fields"):
+            return type(obj)(*[dataclass_to_dict(item) for item in obj])
+        return type(obj)(dataclass_to_dict(item) for item in obj)
+    if isinstance(obj, dict):
+        return {key: dataclass_to_dict(value) for key, value in obj.items()}
+    return obj
+
+
 def dashboard_info_to_json(dashboard_info: DashboardInfo):
-    asdict_result = asdict(dashboard_info)
+    asdict_result = dataclass_to_dict(dashboard_info)
     for widget in asdict_result["widgets"]:
         widget.pop("additionalGraphs", None)
     return json.dumps(asdict_result, cls=NumpyEncoder)
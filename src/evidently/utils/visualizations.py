@@ -19,7 +19,6 @@ from evidently.metric_results import Distribution
 from evidently.metric_results import Histogram
 from evidently.metric_results import HistogramData
 from evidently.metric_results import Label
-from evidently.metric_results import ScatterData
 from evidently.options.color_scheme import ColorOptions
 from evidently.utils.types import ApproxValue
 
@@ -762,8 +761,8 @@ def make_hist_df(hist: Tuple[np.ndarray, np.ndarray]) -> pd.DataFrame:
 
 def plot_scatter(
     *,
-    curr: Dict[str, ScatterData],
-    ref: Optional[Dict[str, ScatterData]],
+    curr: Dict[str, np.ndarray],
+    ref: Optional[Dict[str, np.ndarray]],
     x: str,
     y: str,
     xaxis_name: str = None,
@@ -799,8 +798,8 @@ def plot_scatter(
         fig.update_xaxes(title_text=xaxis_name, row=1, col=2)
     fig.update_layout(yaxis_title=yaxis_name, legend={"itemsizing": "constant"})
     fig.update_traces(marker_size=4)
-    fig = json.loads(fig.to_json())
-    return fig
+    # arrays are left as is: the figure is serialized once with the rest of the dashboard
+    return fig.to_plotly_json()
 
 
 def plot_pred_actual_time(
@@ -1038,6 +1037,13 @@ def get_gaussian_kde(m1, m2):
     return Z, list(x), list(y)
 
 
+def get_binned_density(m1, m2, bins: int = 30):
+    Z, x_edges, y_edges = np.histogram2d(m1, m2, bins=bins, density=True)
+    x = (x_edges[:-1] + x_edges[1:]) / 2
+    y = (y_edges[:-1] + y_edges[1:]) / 2
+    return Z, list(x), list(y)
+
+
 def plot_contour_single(z1: np.ndarray, z2: Optional[np.ndarray], xtitle: str = "", ytitle: str = ""):
     color_options = ColorOptions()
     if z2 is not None:
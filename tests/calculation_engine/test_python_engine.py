@@ -65,3 +65,39 @@ def test_python_engine2():
     ctx = Context(None, [metric], [], dict(), dict(), States.Verified, renderers=DEFAULT_RENDERERS)
     engine.execute_metrics(ctx, GenericInputData(pd.DataFrame(), pd.DataFrame(), ColumnMapping(), None, {}))
     assert ctx.metric_results[metric] == 25
+
+
+class DependentMetric(Metric[int]):
+    dependency: OldTypeSimpleMetric
+
+    def __init__(self, value: int):
+        self.dependency = OldTypeSimpleMetric(value)
+        super().__init__()
+
+    def calculate(self, data: InputData) -> int:
+        return self.dependency.get_result() * 2
+
+
+def test_python_engine_parallel():
+    metric = DependentMetric(10)
+    other = OldTypeSimpleMetric(20)
+    metrics = [metric.dependency, metric, other]
+    engine = PythonEngine()
+    engine.set_metrics(metrics)
+    ctx = Context(None, metrics, [], dict(), dict(), States.Verified, renderers=DEFAULT_RENDERERS)
+    for m in metrics:
+        m.set_context(ctx)
+    engine.execute_metrics(
+        ctx, GenericInputData(pd.DataFrame(), pd.DataFrame(), ColumnMapping(), None, {}), max_workers=2
+    )
+    assert ctx.metric_results[metric.dependency] == 25
+    assert ctx.metric_results[metric] == 50
+    assert ctx.metric_results[other] == 35
+
+
+def test_python_engine_shares_columns_info():
+    current_data = pd.DataFrame({"target": [1, 2], "prediction": [1, 3], "feature": ["a", "b"]})
+    data = PythonEngine().convert_input_data(GenericInputData(None, current_data, ColumnMapping(), None, {}))
+    assert data.columns_info is not None
+    assert data.columns_info.utility_columns.target == "target"
+    assert data.columns_info.cat_feature_names == ["feature"]
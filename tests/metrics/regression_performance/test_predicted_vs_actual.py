@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from evidently.metrics import RegressionPredictedVsActualScatter
+from evidently.options.agg_data import RenderOptions
+from evidently.options.base import Options
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.report import Report
+
+
+def test_regression_predicted_vs_actual_scatter_drops_not_finite_values() -> None:
+    current_data = pd.DataFrame(
+        {
+            "feature": ["a", "b", "c", "d", "e"],
+            "target": [1, 2, np.inf, 4, 5],
+            "prediction": [1.5, np.nan, 3, -np.inf, 4.5],
+        }
+    )
+    metric = RegressionPredictedVsActualScatter()
+    report = Report(metrics=[metric], options=Options(render=RenderOptions(raw_data=True)))
+    report.run(current_data=current_data, reference_data=current_data, column_mapping=ColumnMapping())
+
+    result = metric.get_result()
+    assert not result.agg_data
+    assert list(result.current_raw.actual) == [1, 5]
+    assert list(result.current_raw.predicted) == [1.5, 4.5]
+    assert list(result.reference_raw.actual) == [1, 5]
+    assert report.show()
+    assert report.json()
+
+
+def test_regression_predicted_vs_actual_scatter_nullable_columns() -> None:
+    current_data = pd.DataFrame(
+        {
+            "target": pd.array([1, 2, 3, None, 5] * 20, dtype="Int64"),
+            "prediction": pd.array([1, 2, 4, 3, None] * 20, dtype="Int64"),
+        }
+    )
+    for raw_data in (True, False):
+        metric = RegressionPredictedVsActualScatter()
+        report = Report(metrics=[metric], options=Options(render=RenderOptions(raw_data=raw_data)))
+        report.run(current_data=current_data, reference_data=current_data, column_mapping=ColumnMapping())
+
+        result = metric.get_result()
+        assert result.agg_data is not raw_data
+        if raw_data:
+            assert sorted(result.current_raw.actual) == [1.0, 2.0, 3.0]
+            assert sorted(result.current_raw.predicted) == [1.0, 2.0, 4.0]
+        assert report.get_html()
+        assert report.json()
+
+
+def test_regression_predicted_vs_actual_scatter_rounds_plot_values() -> None:
+    current_data = pd.DataFrame({"target": [1 / 3, 10.0, 2 / 3], "prediction": [0.5, 9.0, np.pi]})
+    metric = RegressionPredictedVsActualScatter()
+    report = Report(metrics=[metric], options=Options(render=RenderOptions(raw_data=True)))
+    report.run(current_data=current_data, reference_data=None, column_mapping=ColumnMapping())
+
+    _, dashboard_info, _ = report._build_dashboard_info()
+    trace = dashboard_info.widgets[1].params["data"][0]
+    assert list(trace["x"]) == [0.3333, 10.0, 0.6667]
+    assert list(trace["y"]) == [0.5, 9.0, 3.1416]
+
+
+def test_regression_predicted_vs_actual_scatter_bins_large_data() -> None:
+    size = 60000
+    target = np.random.default_rng(0).normal(size=size)
+    current_data = pd.DataFrame({"target": target, "prediction": target + np.random.default_rng(1).normal(size=size)})
+    metric = RegressionPredictedVsActualScatter()
+    report = Report(metrics=[metric])
+    report.run(current_data=current_data, reference_data=None, column_mapping=ColumnMapping())
+
+    result = metric.get_result()
+    assert result.agg_data
+    density, x, y = result.current_agg.data
+    assert density.shape == (30, 30)
+    assert len(x) == len(y) == 30
+    assert report.show()
+
+
+def test_regression_predicted_vs_actual_scatter_reuses_agg_figure() -> None:
+    target = np.random.default_rng(0).normal(size=100)
+    current_data = pd.DataFrame({"target": target, "prediction": target + np.random.default_rng(1).normal(size=100)})
+    report = Report(metrics=[RegressionPredictedVsActualScatter()])
+    report.run(current_data=current_data, reference_data=current_data, column_mapping=ColumnMapping())
+
+    _, first, _ = report._build_dashboard_info()
+    _, second, _ = report._build_dashboard_info()
+    assert first.widgets[1].params["data"] is second.widgets[1].params["data"]
+    assert len(first.widgets[1].params["data"]) == 2
+    assert report.json()
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from evidently.metrics.regression_performance.utils import make_df_for_plot
+
+
+def test_make_df_for_plot_sorts_by_datetime() -> None:
+    df = pd.DataFrame(
+        {
+            "target": [1, 2, np.inf, 4, 5],
+            "prediction": [1.5, 2.5, 3.5, np.nan, 5.5],
+            "dt": pd.to_datetime(["2020-01-03", "2020-01-01", "2020-01-02", "2020-01-04", None]),
+            "feature": ["a", "b", "c", "d", "e"],
+        }
+    )
+    result = make_df_for_plot(df, "target", "prediction", "dt")
+    assert list(result.columns) == ["target", "prediction", "dt"]
+    assert list(result.index) == [1, 0]
+    assert list(result["target"]) == [2, 1]
+
+
+def test_make_df_for_plot_sorts_by_index() -> None:
+    df = pd.DataFrame({"target": [1, 2, 3, 4], "prediction": [1.5, -np.inf, 3.5, 4.5]}, index=[3, 1, 0, 2])
+    result = make_df_for_plot(df, "target", "prediction", None)
+    assert list(result.index) == [0, 2, 3]
+    assert list(result["prediction"]) == [3.5, 4.5, 1.5]
+
+
+def test_make_df_for_plot_handles_integer_and_nullable_columns() -> None:
+    df = pd.DataFrame(
+        {
+            "target": [1, 2, 3, 4],
+            "prediction": pd.array([1, None, 3, 4], dtype="Int64"),
+            "other": [1.0, 2.0, np.inf, 4.0],
+        }
+    )
+    result = make_df_for_plot(df, "target", "prediction", None)
+    assert list(result.index) == [0, 2, 3]
+    result = make_df_for_plot(df, "target", "other", None)
+    assert list(result.index) == [0, 1, 3]
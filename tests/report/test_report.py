@@ -1,3 +1,4 @@
+import io
 import json
 from typing import List
 
@@ -8,10 +9,13 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.metric_results import Distribution
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import DatasetSummaryMetric
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.report import Report
+from evidently.utils import NumpyEncoder
 
 
 class MockMetricResult(MetricResult):
@@ -59,3 +63,33 @@ def test_json(report: Report):
 
     include_series = json.loads(report.json(include={"MockMetric": {"value", "series"}}))["metrics"]
     assert include_series == [{"metric": "MockMetric", "result": {"value": "a", "series": [0]}}]
+
+
+def test_stream_as_json(report: Report):
+    fp = io.StringIO()
+    report.stream_as_json(fp, include={"MockMetric": {"value", "series"}})
+    assert json.loads(fp.getvalue()) == {"metrics": [{"metric": "MockMetric", "result": {"value": "a", "series": [0]}}]}
+
+    two_metrics_report = Report(metrics=[ColumnSummaryMetric("a"), DatasetSummaryMetric()])
+    two_metrics_report.run(reference_data=None, current_data=pd.DataFrame({"a": [1, 2, 3]}))
+    fp = io.StringIO()
+    two_metrics_report.stream_as_json(fp)
+    assert json.loads(fp.getvalue()) == json.loads(json.dumps(two_metrics_report.as_dict(), cls=NumpyEncoder))
+
+
+def test_render_max_workers():
+    current_data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    sequential = Report(
+        metrics=[ColumnSummaryMetric(column_name="a"), ColumnSummaryMetric(column_name="b"), DatasetSummaryMetric()]
+    )
+    sequential.run(reference_data=None, current_data=current_data)
+    parallel = Report(
+        metrics=[ColumnSummaryMetric(column_name="a"), ColumnSummaryMetric(column_name="b"), DatasetSummaryMetric()],
+        render_max_workers=4,
+    )
+    parallel.run(reference_data=None, current_data=current_data)
+
+    assert parallel.as_dict() == sequential.as_dict()
+    _, sequential_info, _ = sequential._build_dashboard_info()
+    _, parallel_info, _ = parallel._build_dashboard_info()
+    assert [widget.id for widget in parallel_info.widgets] == [widget.id for widget in sequential_info.widgets]
@@ -0,0 +1,28 @@
+import dataclasses
+
+import numpy as np
+
+from evidently.model.widget import AdditionalGraphInfo
+from evidently.model.widget import BaseWidgetInfo
+from evidently.utils.dashboard import dataclass_to_dict
+
+
+def test_dataclass_to_dict():
+    data = np.array([1, 2, 3])
+    widget = BaseWidgetInfo(
+        type="big_graph",
+        title="",
+        size=2,
+        id="widget",
+        params={"data": [{"x": data}], "layout": {}},
+        additionalGraphs=[AdditionalGraphInfo(id="graph", params={"y": [1, 2]})],
+        widgets=[BaseWidgetInfo(type="counter", title="inner", size=1, id="inner")],
+    )
+
+    result = dataclass_to_dict(widget)
+
+    expected = dataclasses.asdict(widget)
+    assert result.keys() == expected.keys()
+    assert result["additionalGraphs"] == expected["additionalGraphs"]
+    assert result["widgets"] == expected["widgets"]
+    assert result["params"]["data"][0]["x"] is data